@@ -24,12 +24,10 @@ Note: This is the central controller for orchestrating the application's workflo
 import os
 from datetime import datetime
 
-from model.ProfileSettings import ProfileSettings
 from model.Language import Language
 from model.Theme import Theme
 from model.Translator import Translator
 from model.Transcriber import Transcriber
-from PyQt5.QtWidgets import QPushButton
 from view.MainFrame import MainFrame
 from view.SubtitleWindow import SubtitleWindow
 
@@ -38,9 +36,11 @@ class AppController:
         self.view = view
         self.transcriber = None
         self.translator = None
+        self.subtitle_window = None
         self.is_recording = False
 
-        self.profile_settings = ProfileSettings()
+        # Share the view's settings so both sides see the same preferences
+        self.profile_settings = view.profile_settings
 
         self.connect_signals()
 
@@ -49,26 +49,22 @@ class AppController:
         self.view.settings_btn.clicked.connect(self.view.set_settings_view)
         self.view.play_btn.clicked.connect(self.on_play_clicked)
 
-        for btn in self.view.topic_buttons:
-            if isinstance(btn, QPushButton):
-                btn.clicked.connect(lambda _, b=btn: self.on_topic_clicked(b.text()))
+        self.view.log_selected.connect(self.on_topic_clicked)
 
         self.view.language_changed.connect(self.on_language_changed)
         self.view.theme_changed.connect(self.on_theme_changed)
 
     def on_language_changed(self, lang_label):
-        for lang in Language:
-            if lang.label == lang_label:
-                self.profile_settings.translated_language = lang
-                print(f"[Settings] Translated language set to: {lang.label} ({lang.code})")
-                break
+        lang = Language.from_label(lang_label)
+        if lang:
+            self.profile_settings.translated_language = lang
+            print(f"[Settings] Translated language set to: {lang.label} ({lang.code})")
 
     def on_theme_changed(self, theme_label):
-        for theme in Theme:
-            if theme.value == theme_label:
-                self.profile_settings.theme = theme
-                print(f"[Settings] Theme set to: {theme.value}")
-                break
+        theme = Theme.from_value(theme_label)
+        if theme:
+            self.profile_settings.theme = theme
+            print(f"[Settings] Theme set to: {theme.value}")
 
     def on_play_clicked(self):
         if not self.is_recording:
@@ -81,13 +77,18 @@ class AppController:
                     api_key=deepgram_api_key,
                     language=self.profile_settings.source_language.code,
                     on_transcript=self.handle_transcription,
-                    profile_settings=self.profile_settings
+                    profile_settings=self.profile_settings,
+                    on_pending=self.handle_pending_transcription
                 )
                 self.transcriber.start()
 
-                self.subtitle_window = SubtitleWindow()
+                # One overlay serves every session, so its reader thread is never orphaned
+                if self.subtitle_window is None:
+                    self.subtitle_window = SubtitleWindow()
+                    self.view.set_subtitle_window(self.subtitle_window)
+                self.subtitle_window.set_live(True)  # The transcriber callbacks feed it directly
+                self.subtitle_window.label.setHidden(False)
                 self.subtitle_window.show()
-                self.view.set_subtitle_window(self.subtitle_window)
 
                 self.is_recording = True
                 self.view.play_btn.setText("Stop")
@@ -100,14 +101,20 @@ class AppController:
                 self.transcriber.stop()
             self.is_recording = False
             self.view.play_btn.setText("Play")
+            self.view.subtitle_window.set_live(False)
             self.view.subtitle_window.label.setHidden(True)
 
+    def handle_pending_transcription(self, original):
+        # Show the source text until its translation arrives
+        if self.subtitle_window:
+            self.subtitle_window.append_line(original)
+
     def handle_transcription(self, original, translated):
         print(f"[Original] {original}")
         print(f"[Translated] → {translated}\n")
 
         if self.subtitle_window:
-            self.subtitle_window.append_line(original, translated)
+            self.subtitle_window.update_last_line(translated)
 
 
     def on_topic_clicked(self, topic_name):
@@ -0,0 +1,140 @@
+"""
+================================================================================
+ HistoryLog - Line Format of Interprefy History Files
+================================================================================
+
+Each history line starts with a prefix that records its direction, so readers
+do not have to infer it from the line's position:
+    S<TAB>text   original (transcribed) text, shown as a sent bubble
+    R<TAB>text   translated text, shown as a received bubble
+
+Logs written before the prefixes existed alternate original and translated
+lines; parse_lines falls back to that alternation for unprefixed lines.
+
+HistoryReader indexes a file in one streaming pass, keeping only the byte
+offset and direction of each entry, so a large log can be shown a page at a
+time without holding its whole content in memory.
+
+HistoryIndex caches the folder listing (names and mtimes, newest first) for
+a short time, so the sidebar and the subtitle overlay don't each rescan and
+stat every log.
+
+Usage:
+    format_line("Hello", True)        # "S\tHello"
+    list(parse_lines(["S\tHola", "R\tHi"]))  # [("Hola", True), ("Hi", False)]
+    reader = HistoryReader(path)
+    reader.read(len(reader) - 200, len(reader))  # Most recent 200 entries
+    HistoryIndex.list_txt("history")  # [("log.txt", mtime), ...]
+"""
+
+import os
+import time
+from array import array
+
+SENT_PREFIX = "S\t"
+RECEIVED_PREFIX = "R\t"
+_PREFIXES = (SENT_PREFIX.encode(), RECEIVED_PREFIX.encode())
+
+
+def format_line(text, is_sent):
+    """Returns the history line for text, prefixed with its direction."""
+    return (SENT_PREFIX if is_sent else RECEIVED_PREFIX) + text
+
+
+def parse_lines(lines):
+    """Yields (text, is_sent) pairs for the non-empty lines of a history file."""
+    is_sent = True  # Unprefixed legacy lines alternate, starting with the original
+    for line in lines:
+        prefix = line[:2]
+        if prefix == SENT_PREFIX or prefix == RECEIVED_PREFIX:
+            text = line[2:].strip()
+            if text:
+                yield text, prefix == SENT_PREFIX
+        else:
+            text = line.strip()
+            if text:
+                yield text, is_sent
+                is_sent = not is_sent
+
+
+class HistoryReader:
+    def __init__(self, path):
+        self.path = path
+        self._offsets = array("q")  # Byte offset of each entry's line
+        self._sent = bytearray()     # 1 if the entry is original text, 0 if translated
+
+        is_sent = True  # Same legacy alternation as parse_lines
+        pos = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                if raw[:2] in _PREFIXES:
+                    if raw[2:].strip():
+                        self._add(pos, raw[:2] == _PREFIXES[0])
+                elif raw.strip():
+                    self._add(pos, is_sent)
+                    is_sent = not is_sent
+                pos += len(raw)
+
+    def _add(self, offset, is_sent):
+        self._offsets.append(offset)
+        self._sent.append(is_sent)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def read(self, start, stop):
+        """Returns the (text, is_sent) entries in [start, stop), oldest first."""
+        start = max(0, start)
+        entries = []
+        with open(self.path, "rb") as f:
+            for i in range(start, min(stop, len(self._offsets))):
+                f.seek(self._offsets[i])
+                raw = f.readline()
+                if raw[:2] in _PREFIXES:
+                    raw = raw[2:]
+                entries.append((raw.decode("utf-8", errors="replace").strip(), bool(self._sent[i])))
+        return entries
+
+
+class HistoryIndex:
+    TTL = 1.0  # Seconds a listing is reused before the folder is checked again
+
+    _folder = None
+    _dir_mtime = None
+    _checked_at = 0.0
+    _entries = None
+
+    @classmethod
+    def list_txt(cls, folder="history"):
+        """Returns (name, mtime) pairs of the folder's .txt logs, newest first."""
+        try:
+            dir_mtime = os.stat(folder).st_mtime
+        except FileNotFoundError:
+            return []
+
+        now = time.monotonic()
+        if (cls._entries is not None and folder == cls._folder
+                and dir_mtime == cls._dir_mtime and now - cls._checked_at < cls.TTL):
+            return cls._entries
+
+        entries = []
+        append = entries.append
+        with os.scandir(folder) as it:
+            for e in it:
+                name = e.name
+                # Hidden files (e.g. .DS_Store) are dropped before the suffix check
+                if name[:1] == "." or not name.endswith(".txt") or not e.is_file():
+                    continue
+                append((name, e.stat().st_mtime))
+        entries.sort(key=lambda t: t[1], reverse=True)
+
+        cls._folder = folder
+        cls._dir_mtime = dir_mtime
+        cls._checked_at = now
+        cls._entries = entries
+        return entries
+
+    @classmethod
+    def invalidate(cls):
+        """Forces the next list_txt call to rescan, e.g. after a rename or delete."""
+        cls._entries = None
@@ -10,6 +10,7 @@ the translation API (GoogleTranslator).
 Usage:
     Language.ENGLISH.label  # "English"
     Language.ENGLISH.code   # "en"
+    Language.from_label("English")  # Language.ENGLISH
 """
 
 from enum import Enum
@@ -30,4 +31,12 @@ class Language(Enum):
     @property
     def code(self):
         """Returns the language code for translation APIs."""
-        return self.value[1]
\ No newline at end of file
+        return self.value[1]
+
+    @classmethod
+    def from_label(cls, label):
+        """Returns the language with the given display label, or None."""
+        return _BY_LABEL.get(label)
+
+# Built once at import so label lookups are a single dict access
+_BY_LABEL = {lang.label: lang for lang in Language}
@@ -4,23 +4,26 @@
 ================================================================================
 
 Stores and manages user profile settings, including selected source language,
-translated language, and UI theme. Used throughout the application to
+translated language, UI theme, and speech-to-text model size. Used throughout the application to
 customize the user experience.
 """
 
 from model.Language import Language
 from model.Theme import Theme
+from model.WhisperModelSize import WhisperModelSize
 
 class ProfileSettings:
     """
     Stores and manages user profile settings for Interprefy.
-    Provides properties and type checking for language and theme preferences.
+    Provides properties and type checking for language, theme and model preferences.
     """
-    def __init__(self, translated_language=Language.ENGLISH, theme=Theme.DEFAULT, source_language=Language.ENGLISH):
+    def __init__(self, translated_language=Language.ENGLISH, theme=Theme.DEFAULT, source_language=Language.ENGLISH,
+                 whisper_model=WhisperModelSize.BASE):
         # Initialize with default or provided settings
         self._translated_language = translated_language
         self._theme = theme
         self._source_language = source_language
+        self._whisper_model = whisper_model
 
     @property
     def translated_language(self):
@@ -53,4 +56,15 @@ class ProfileSettings:
     def source_language(self, value):
         if not isinstance(value, Language):
             raise ValueError("source_language must be a Language enum value")
-        self._source_language = value
\ No newline at end of file
+        self._source_language = value
+
+    @property
+    def whisper_model(self):
+        # The faster-whisper model size used for transcription (WhisperModelSize enum)
+        return self._whisper_model
+
+    @whisper_model.setter
+    def whisper_model(self, value):
+        if not isinstance(value, WhisperModelSize):
+            raise ValueError("whisper_model must be a WhisperModelSize enum value")
+        self._whisper_model = value
\ No newline at end of file
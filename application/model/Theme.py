@@ -10,6 +10,7 @@ Usage:
     Theme.LIGHT.value   # "Light"
     Theme.DARK.value    # "Dark"
     Theme.DEFAULT.value # "Default"
+    Theme.from_value("Dark")  # Theme.DARK
 """
 
 from enum import Enum
@@ -18,3 +19,11 @@ class Theme(Enum):
     DEFAULT = "Default"
     LIGHT = "Light"
     DARK = "Dark"
+
+    @classmethod
+    def from_value(cls, value):
+        """Returns the theme with the given value, or None."""
+        return _BY_VALUE.get(value)
+
+# Built once at import so value lookups are a single dict access
+_BY_VALUE = {theme.value: theme for theme in Theme}
@@ -5,145 +5,310 @@
 
 This class is responsible for:
     - Capturing system audio using PyAudio from the VB-CABLE virtual device.
-    - Saving audio chunks as temporary WAV files.
+    - Buffering audio chunks in memory as NumPy arrays.
     - Transcribing audio to text using the faster-whisper model.
     - Passing the transcribed text (and optionally translation) to a callback.
-    - Running audio capture and upload in background threads.
+    - Running audio capture, transcription and translation as pipelined background threads.
 
 Note: Translation should be handled in AppController for clean separation.
 """
 
+import contextlib
 import threading
 import pyaudio
+import ctranslate2
 import numpy as np
-import wave
-import time
 import os
 import queue
+import itertools
 import datetime
-from scipy.signal import resample_poly
+from concurrent.futures import ThreadPoolExecutor
+from scipy.signal import firwin, resample_poly
 from faster_whisper import WhisperModel
 from model.Translator import Translator
 from model.ProfileSettings import ProfileSettings
+from model.HistoryLog import format_line
 from view.SubtitleWindow import SubtitleWindow
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
 
 CHUNK = 1024
 FORMAT = pyaudio.paInt16
 CHANNELS = 2
 DEVICE_RATE = 48000
 TARGET_RATE = 16000
-RECORD_SECONDS = 5
+RESAMPLE_TAPS = 65
+
+# Voice activity segmentation: a segment is dispatched once the speaker pauses
+# (trailing silence) and it is long enough, or when it hits the hard cap.
+MIN_SEGMENT_SECONDS = 1.5
+MAX_SEGMENT_SECONDS = 10
+SILENCE_THRESHOLD_DB = -35
+TRAILING_SILENCE_SECONDS = 0.5
+
+# Bounded queues between pipeline stages apply backpressure
+QUEUE_SIZE = 4
+# Translations kept in flight at once, so network round trips overlap
+TRANSLATION_WORKERS = 3
+
+# Run Whisper on the GPU when CTranslate2 can see one (int8 weights with fp16
+# activations use tensor cores); otherwise fall back to int8 on the CPU
+if ctranslate2.get_cuda_device_count() > 0:
+    WHISPER_DEVICE, WHISPER_COMPUTE_TYPE = "cuda", "int8_float16"
+else:
+    WHISPER_DEVICE, WHISPER_COMPUTE_TYPE = "cpu", "int8"
+
+class _TranscriptSignal(QObject):
+    # Carries transcripts from the worker threads to the GUI thread: the source
+    # text as soon as it is known, then (original, translated) once translated
+    transcript_pending = pyqtSignal(str)
+    transcript_ready = pyqtSignal(str, str)
 
 class Transcriber:
     """
     Handles system audio capture and transcription.
     """
-    def __init__(self, api_key=None, language="en", on_transcript=None, profile_settings=None):
+    _vbcable_index = None  # Cached across sessions; PyAudio indexes are stable while devices are
+
+    def __init__(self, api_key=None, language="en", on_transcript=None, profile_settings=None, on_pending=None):
         self.current_history_path = None
+        self._history_fh = None  # Kept open for the whole session
         self.language = language
         self.on_transcript = on_transcript  # Callback for delivering transcript (and translation)
+        self.on_pending = on_pending  # Callback for the source text while its translation is in flight
+        # Created on the GUI thread, so queued emits from workers run the callbacks there
+        self._transcript_signal = _TranscriptSignal()
+        self._transcript_signal.transcript_pending.connect(self._deliver_pending, Qt.QueuedConnection)
+        self._transcript_signal.transcript_ready.connect(self._deliver_transcript, Qt.QueuedConnection)
         self.profile_settings = profile_settings or ProfileSettings()
         self.translator = Translator(self.profile_settings)
-        self.audio_interface = pyaudio.PyAudio()
         self.running = False
         self.thread = None
-        self.audio_queue = queue.Queue()
-        self.upload_thread = None
-        # Load Whisper model once for efficiency
-        self.whisper_model = WhisperModel("base", device="cpu", compute_type="int8")
+        # Pipeline: audio_queue -> STT -> text_queue -> MT -> output_queue -> UI
+        self.audio_queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.text_queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.output_queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.worker_threads = []
+        self._chunk_ids = itertools.count()  # Sequential ids for correlating segments in logs
+        self._translation_pool = ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS)
+        self._history_pool = ThreadPoolExecutor(max_workers=1)  # Single worker keeps writes ordered
+        # Anti-aliasing low-pass for the 48 kHz -> 16 kHz decimation, designed once
+        self._resample_taps = firwin(RESAMPLE_TAPS, cutoff=7800, fs=DEVICE_RATE)
+        # Reusable 48 kHz mono segment buffer (max segment plus one chunk of headroom)
+        self._capture_buf = np.empty(DEVICE_RATE * MAX_SEGMENT_SECONDS + CHUNK, dtype=np.int16)
+        # Load and warm up the Whisper model in the background so the UI thread never blocks on it
+        self.whisper_model = None
+        self._model_ready = threading.Event()
+        threading.Thread(target=self._load_model, daemon=True).start()
+
+    def _load_model(self):
+        # CTranslate2 allocates weights and workspaces lazily, so run one silent
+        # inference up front instead of paying for it on the first real segment
+        try:
+            self.whisper_model = WhisperModel(
+                self.profile_settings.whisper_model.value,
+                device=WHISPER_DEVICE,
+                compute_type=WHISPER_COMPUTE_TYPE,
+                cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                num_workers=2
+            )
+            silence = np.zeros(TARGET_RATE, dtype=np.float32)
+            segments, _ = self.whisper_model.transcribe(silence, without_timestamps=True)
+            list(segments)
+            list(self._transcribe_whisper(silence))  # Also loads the VAD model used by vad_filter
+        except Exception as e:
+            print(f"[Whisper Load Error] {e}")
+        finally:
+            self._model_ready.set()
+
+    @staticmethod
+    def _is_vbcable(dev):
+        name = dev.get('name', '').lower()
+        return "cable output" in name and "virtual cable" in name and dev.get('maxInputChannels', 0) == 2
 
-    def _find_vbcable_device(self):
+    def _find_vbcable_device(self, audio_interface):
         # Find the VB-CABLE virtual audio device for system audio capture
-        for i in range(self.audio_interface.get_device_count()):
-            dev = self.audio_interface.get_device_info_by_index(i)
-            name = dev.get('name', '').lower()
-            if "cable output" in name and "virtual cable" in name and dev.get('maxInputChannels', 0) == 2:
+        device_count = audio_interface.get_device_count()
+        cached = Transcriber._vbcable_index
+        if cached is not None and cached < device_count:
+            # One query to confirm the devices haven't changed since the last session
+            if self._is_vbcable(audio_interface.get_device_info_by_index(cached)):
+                return cached
+
+        infos = [audio_interface.get_device_info_by_index(i) for i in range(device_count)]
+        for i, dev in enumerate(infos):
+            if self._is_vbcable(dev):
                 print(f"[VB-CABLE] Using device: {dev['name']}")
+                Transcriber._vbcable_index = i
                 return i
         raise RuntimeError("VB-CABLE device not found.")
 
-    def _save_wav(self, filename, audio_data):
-        # Save raw audio data as a mono WAV file
-        with wave.open(filename, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(self.audio_interface.get_sample_size(FORMAT))
-            wf.setframerate(TARGET_RATE)
-            wf.writeframes(audio_data)
-
-    def _transcribe_whisper(self, wav_path):
-        # Transcribe audio file to text using Whisper
-        segments, info = self.whisper_model.transcribe(wav_path)
-        transcript = ""
+    def _transcribe_whisper(self, audio):
+        # Transcribe an in-memory float32 mono buffer (16 kHz) to text using Whisper.
+        # Yields each segment's text as soon as it is decoded, together with the
+        # language code Whisper detects for the audio. No language is passed, since
+        # the configured source language is only a placeholder, not the spoken one.
+        segments, info = self.whisper_model.transcribe(
+            audio,
+            without_timestamps=True,
+            vad_filter=True
+        )
         for segment in segments:
-            transcript += segment.text.strip() + " "
-        return transcript.strip()
+            text = segment.text.strip()
+            if text:
+                yield text, info.language
+
+    def _downsample(self, mono):
+        # Resample a whole segment at once with the precomputed FIR filter.
+        # The result is a new array, so the capture buffer can be reused right away.
+        return resample_poly(mono, TARGET_RATE, DEVICE_RATE, window=self._resample_taps).astype(np.int16)
+
+    @staticmethod
+    def _is_silent(samples):
+        # Energy-based VAD: compare the frame's RMS level (dBFS) to the threshold
+        rms = np.sqrt(np.mean(samples.astype(np.float32) ** 2))
+        if rms == 0:
+            return True
+        return 20 * np.log10(rms / 32768.0) < SILENCE_THRESHOLD_DB
+
+    def _stt_worker(self):
+        # Stage 1: transcribe audio segments; a None item signals shutdown
+        self._model_ready.wait()
+        while True:
+            item = self.audio_queue.get()
+            if item is None:
+                self.text_queue.put(None)
+                return
+            chunk_id, audio = item
+            try:
+                # Whisper expects float32 samples normalized to [-1, 1]
+                audio_f32 = audio.astype(np.float32) / 32768.0
+                for transcript, language in self._transcribe_whisper(audio_f32):
+                    self.text_queue.put((transcript, language))
+            except Exception as e:
+                print(f"[Error] chunk {chunk_id}: {e}")
+
+    def _translate_transcript(self, transcript, language):
+        # Translate sentence by sentence so cached sentences are reused
+        sentences = Translator.split_sentences(transcript)
+        return " ".join(self.translator.translate_batch(sentences, detected_lang=language))
+
+    def _mt_worker(self):
+        # Stage 2: start translations while STT works on the next segment. Several
+        # translations can be in flight; futures are queued in transcript order.
+        while True:
+            item = self.text_queue.get()
+            if item is None:
+                self.output_queue.put(None)
+                return
+            transcript, language = item
+            future = self._translation_pool.submit(self._translate_transcript, transcript, language)
+            self.output_queue.put((transcript, future))
+
+    def _ui_dispatcher(self):
+        # Stage 3: hand results to the UI in transcript order, then log them
+        while True:
+            item = self.output_queue.get()
+            if item is None:
+                return
+            transcript, future = item
+            if not future.done():
+                # Show the source text while the translation is still in flight
+                self._transcript_signal.transcript_pending.emit(transcript)
+            try:
+                translated = future.result()
+            except Exception as e:
+                print(f"[Error] {e}")
+                continue
+            self._transcript_signal.transcript_ready.emit(transcript, translated)
+            self._history_pool.submit(self._append_to_history, transcript, translated)
+
+    def _deliver_pending(self, transcript):
+        # Runs on the GUI thread: call the pending callback with the source text
+        if not self.on_pending:
+            return
+        try:
+            self.on_pending(transcript)
+        except Exception as e:
+            print(f"[Transcriber Callback Error] {e}")
+
+    def _deliver_transcript(self, transcript, translated):
+        # Runs on the GUI thread: call the callback with transcript and translation
+        if not self.on_transcript:
+            return
+        try:
+            self.on_transcript(transcript, translated)
+        except Exception as e:
+            print(f"[Transcriber Callback Error] {e}")
 
     def _record_loop(self):
+        # PyAudio and the input stream live only for this session and are
+        # released on every exit path, including a failed device lookup
+        with contextlib.ExitStack() as cleanup:
+            audio_interface = pyaudio.PyAudio()
+            cleanup.callback(audio_interface.terminate)
+            device_index = self._find_vbcable_device(audio_interface)
+            stream = audio_interface.open(
+                format=FORMAT,
+                channels=CHANNELS,
+                rate=DEVICE_RATE,
+                input=True,
+                input_device_index=device_index,
+                frames_per_buffer=CHUNK
+            )
+            cleanup.callback(stream.close)
+            cleanup.callback(stream.stop_stream)  # Callbacks run in reverse: stop, close, terminate
+            self._capture(stream)
+        print("[Recorder] Stopped.")
+
+    def _capture(self, stream):
         # Main loop for audio capture and transcription
-        device_index = self._find_vbcable_device()
-        stream = self.audio_interface.open(
-            format=FORMAT,
-            channels=CHANNELS,
-            rate=DEVICE_RATE,
-            input=True,
-            input_device_index=device_index,
-            frames_per_buffer=CHUNK
-        )
         self.running = True
-        print("[Recorder] Recording from VB-CABLE every 5 seconds...")
-
-        def uploader():
-            # Handles processing and transcription of audio chunks in a background thread
-            while self.running or not self.audio_queue.empty():
-                try:
-                    filename, raw_audio = self.audio_queue.get(timeout=1)
-                except queue.Empty:
-                    continue
-                self._save_wav(filename, raw_audio)
-                try:
-                    transcript = self._transcribe_whisper(filename)
-                    if transcript and self.on_transcript:
-                        translated = self.translator.translate(transcript)
-                        self._append_to_history(transcript, translated)
-                        # Call the callback with transcript and translation
-                        def safe_callback():
-                            try:
-                                self.on_transcript(transcript, translated)
-                            except Exception as e:
-                                print(f"[Transcriber Callback Error] {e}")
-                        QTimer.singleShot(0, safe_callback)
-                except Exception as e:
-                    print(f"[Error] {e}")
-                finally:
-                    if os.path.exists(filename):
-                        os.remove(filename)
-
-            translated = self.translator.translate(transcript)
-            self._append_to_history(transcript, translated)
-
-        # Start uploader thread
-        self.upload_thread = threading.Thread(target=uploader, daemon=True)
-        self.upload_thread.start()
+        print("[Recorder] Recording from VB-CABLE, segmenting on speech pauses...")
+
+        # Start the transcription -> translation -> output pipeline stages
+        self.worker_threads = [
+            threading.Thread(target=worker, daemon=True)
+            for worker in (self._stt_worker, self._mt_worker, self._ui_dispatcher)
+        ]
+        for worker_thread in self.worker_threads:
+            worker_thread.start()
 
         # Main audio capture loop
-        while self.running:
-            frames = []
-            for _ in range(0, int(DEVICE_RATE / CHUNK * RECORD_SECONDS)):
+        write_idx = 0
+        silence_seconds = 0.0
+        has_speech = False
+        try:
+            while self.running:
                 data = stream.read(CHUNK, exception_on_overflow=False)
                 audio_array = np.frombuffer(data, dtype=np.int16).reshape(-1, 2)
-                mono = audio_array.mean(axis=1).astype(np.int16)
-                resampled = resample_poly(mono, TARGET_RATE, DEVICE_RATE).astype(np.int16)
-                frames.append(resampled.tobytes())
-            raw_audio = b''.join(frames)
-            filename = f"temp_{int(time.time()*1000)}.wav"
-            self.audio_queue.put((filename, raw_audio))
-
-        stream.stop_stream()
-        stream.close()
-        self.audio_interface.terminate()
-        print("[Recorder] Stopped.")
-        self.view.subtitle_window.label.setHidden(True)
+                # Integer downmix straight into the segment buffer, no float64 round-trip
+                frame_len = len(audio_array)
+                mono = self._capture_buf[write_idx:write_idx + frame_len]
+                mono[:] = audio_array.sum(axis=1, dtype=np.int32) >> 1
+                write_idx += frame_len
+
+                if self._is_silent(mono):
+                    silence_seconds += frame_len / DEVICE_RATE
+                else:
+                    silence_seconds = 0.0
+                    has_speech = True
+
+                segment_seconds = write_idx / DEVICE_RATE
+                paused = silence_seconds >= TRAILING_SILENCE_SECONDS and segment_seconds >= MIN_SEGMENT_SECONDS
+                if paused or segment_seconds >= MAX_SEGMENT_SECONDS:
+                    # Only dispatch segments that actually contain speech
+                    if has_speech:
+                        self.audio_queue.put((next(self._chunk_ids), self._downsample(self._capture_buf[:write_idx])))
+                    write_idx = 0
+                    silence_seconds = 0.0
+                    has_speech = False
+
+            # Flush whatever was still being spoken when recording stopped
+            if has_speech:
+                self.audio_queue.put((next(self._chunk_ids), self._downsample(self._capture_buf[:write_idx])))
+        finally:
+            # Let the pipeline stages drain and exit
+            self.audio_queue.put(None)
 
 
     def start(self):
@@ -151,8 +316,8 @@ class Transcriber:
         date_time = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         os.makedirs("history", exist_ok=True)
         self.current_history_path = os.path.join("history", f"history_{date_time}.txt")
-        with open(self.current_history_path, "w", encoding="utf-8") as f:
-            f.write("")  # Start with an empty file
+        # Start with an empty file and keep it open instead of reopening per transcript
+        self._history_fh = open(self.current_history_path, "w", encoding="utf-8", buffering=8192)
 
         # Start the recording and transcription process in a background thread
         self.thread = threading.Thread(target=self._record_loop, daemon=True)
@@ -164,16 +329,21 @@ class Transcriber:
         self.running = False
         if self.thread:
             self.thread.join()
-        if self.upload_thread:
-            self.upload_thread.join()
+        for worker_thread in self.worker_threads:
+            worker_thread.join()
+        self._translation_pool.shutdown(wait=False)
+        self._history_pool.shutdown(wait=True)  # Flush pending writes before closing the file
+        if self._history_fh:
+            self._history_fh.close()
+            self._history_fh = None
 
     import datetime
 
     def _append_to_history(self, original_text, translated_text):
-        if not self.current_history_path:
+        if not self._history_fh:
             return  # Fail silently if no file is initialized
-        with open(self.current_history_path, "a", encoding="utf-8") as f:
-            print(original_text)
-            print(translated_text)
-            f.write(original_text.strip() + "\n")
-            f.write(translated_text.strip() + "\n")
+        self._history_fh.write(
+            f"{format_line(original_text.strip(), True)}\n{format_line(translated_text.strip(), False)}\n"
+        )
+        # SubtitleWindow tails this file, so push each pair out as one write
+        self._history_fh.flush()
@@ -7,6 +7,8 @@ Responsible for translating text from one language to another using the Google T
 Translating input text into the target language specified in profile settings.
 Automatically detecting the source language using GoogleTranslator.
 Handling translation failures gracefully with a fallback to original text.
+Reusing one GoogleTranslator per target language and caching recent translations.
+Translating transcripts sentence by sentence in batches so the cache hits per sentence.
 Encapsulating translation logic to maintain separation from UI and audio logic.
 
 Dependencies:
@@ -16,19 +18,101 @@ Dependencies:
 """
 
 
+import re
+import threading
+from collections import OrderedDict
+
 from deep_translator import GoogleTranslator
 from model.ProfileSettings import ProfileSettings
 from model.Language import Language
 from view.SubtitleWindow import SubtitleWindow
 
+CACHE_SIZE = 2048
+
 class Translator:
+    # Sentence boundaries (Latin and CJK terminators), compiled once
+    _SENT_SPLIT = re.compile(r'(?<=[.!?。！？])\s+')
+
     def __init__(self, profile_settings):
         self.profile_settings = profile_settings
+        # GoogleTranslator keeps per-request state, so each thread gets its own
+        # instances (one per target language code)
+        self._local = threading.local()
+        # LRU cache of (text, target) -> translation so repeated sentences skip the network
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def split_sentences(cls, text):
+        """Splits text into sentences so each can be translated and cached on its own."""
+        return [s for s in cls._SENT_SPLIT.split(text) if s]
+
+    def _get_translator(self, target_lang):
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+        translator = translators.get(target_lang)
+        if translator is None:
+            translator = GoogleTranslator(target=target_lang, source="auto")
+            translators[target_lang] = translator
+        return translator
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            translated = self._cache.get(key)
+            if translated is not None:
+                self._cache.move_to_end(key)
+            return translated
 
-    def translate(self, text):
+    def _cache_put(self, key, translated):
+        with self._cache_lock:
+            self._cache[key] = translated
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _is_target_language(self, detected_lang=None):
+        # Nothing to translate when the detected speech is already in the target language
+        target = self.profile_settings.translated_language
+        # Whisper reports bare codes ("zh"), so compare against the primary subtag ("zh-cn")
+        return detected_lang is not None and target.code.split("-")[0] == detected_lang
+
+    def translate(self, text, detected_lang=None):
+        if self._is_target_language(detected_lang):
+            return text
         target_lang = self.profile_settings.translated_language.code
+        cached = self._cache_get((text, target_lang))
+        if cached is not None:
+            return cached
         try:
-            return GoogleTranslator(target=target_lang, source="auto").translate(text)
+            translated = self._get_translator(target_lang).translate(text)
         except Exception as e:
             print(f"[Translator Error] {e}")
             return text  # fallback to original if translation fails
+        self._cache_put((text, target_lang), translated)
+        return translated
+
+    def translate_batch(self, texts, detected_lang=None):
+        # Translate a list of sentences, only sending cache misses to the API
+        if self._is_target_language(detected_lang):
+            return list(texts)
+        target_lang = self.profile_settings.translated_language.code
+        results = {}
+        for text in texts:
+            cached = self._cache_get((text, target_lang))
+            if cached is not None:
+                results[text] = cached
+
+        misses = list(dict.fromkeys(text for text in texts if text not in results))
+        if misses:
+            try:
+                translated = self._get_translator(target_lang).translate_batch(misses)
+            except Exception as e:
+                print(f"[Translator Error] {e}")
+                translated = misses  # fallback to originals if translation fails
+            else:
+                for text, result in zip(misses, translated):
+                    self._cache_put((text, target_lang), result)
+            results.update(zip(misses, translated))
+
+        return [results[text] for text in texts]
@@ -0,0 +1,21 @@
+"""
+================================================================================
+ WhisperModelSize - Supported Speech-to-Text Model Sizes for Interprefy
+================================================================================
+
+Defines the faster-whisper model sizes the Transcriber can load. Smaller models
+transcribe faster at some cost in accuracy; distil models trade a little
+accuracy for a large speedup on English audio.
+
+Usage:
+    WhisperModelSize.BASE.value             # "base"
+    WhisperModelSize.DISTIL_SMALL_EN.value  # "distil-small.en"
+"""
+
+from enum import Enum
+
+class WhisperModelSize(Enum):
+    TINY = "tiny"
+    BASE = "base"
+    SMALL = "small"
+    DISTIL_SMALL_EN = "distil-small.en"
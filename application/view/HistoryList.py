@@ -0,0 +1,144 @@
+"""
+================================================================================
+ HistoryList - Item Model and Delegate for the Chat History Sidebar
+================================================================================
+
+This module is responsible for:
+    - Holding the sidebar's section headers and history log files in one list model.
+    - Painting each header and log row (title plus rename/delete icons) on demand.
+    - Translating clicks on a row into open/rename/delete signals.
+
+Rows are painted by a single delegate instead of being built from a QWidget
+and three QPushButtons each, and the whole history is one QListView, so only
+the rows in view are laid out and painted however many logs there are.
+
+Dependencies:
+    - PyQt5 for the model/view classes and painting.
+"""
+
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QRect, QSize, pyqtSignal
+from PyQt5.QtGui import QPalette, QColor, QFont
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem, QApplication
+
+FILENAME_ROLE = Qt.UserRole
+HEADER_ROLE = Qt.UserRole + 1
+ROW_HEIGHT = 40
+HEADER_FONT_SIZE = 14
+HEADER_COLOR = QColor("#777")
+ICON_WIDTH = 30
+RENAME_ICON = "✏️"
+DELETE_ICON = "❌"
+
+
+class HistoryModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (is_header, section title or log filename, display text)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        is_header, value, text = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == FILENAME_ROLE:
+            return None if is_header else value
+        if role == HEADER_ROLE:
+            return is_header
+        return None
+
+    def flags(self, index):
+        # Headers can't be hovered or clicked
+        if index.isValid() and self._rows[index.row()][0]:
+            return Qt.NoItemFlags
+        return super().flags(index)
+
+    def set_sections(self, sections):
+        # Rebuild every row at once, each (title, files) section as a header then its logs
+        self.beginResetModel()
+        self._rows = []
+        for title, files in sections:
+            self._rows.append((True, title, title))
+            self._rows.extend(self._file_rows(files))
+        self.endResetModel()
+
+    def add_section(self, title, files):
+        # Append a header and its logs, e.g. when older logs are loaded on demand
+        if not files:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(files))
+        self._rows.append((True, title, title))
+        self._rows.extend(self._file_rows(files))
+        self.endInsertRows()
+
+    @staticmethod
+    def _file_rows(files):
+        # Titles are computed once per file; every listed log ends in ".txt"
+        return [(False, filename, filename[:-4]) for filename in files]
+
+
+class HistoryDelegate(QStyledItemDelegate):
+    # Each carries the log's filename, read from the clicked row
+    open_requested = pyqtSignal(str)
+    rename_requested = pyqtSignal(str)
+    delete_requested = pyqtSignal(str)
+
+    @staticmethod
+    def _delete_rect(rect):
+        return QRect(rect.right() - ICON_WIDTH + 1, rect.top(), ICON_WIDTH, rect.height())
+
+    @staticmethod
+    def _rename_rect(rect):
+        return QRect(rect.right() - 2 * ICON_WIDTH + 1, rect.top(), ICON_WIDTH, rect.height())
+
+    def paint(self, painter, option, index):
+        if index.data(HEADER_ROLE):
+            self._paint_header(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+
+        # Row background (hover) across the full width, then title and icons on top
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+        painter.save()
+        painter.setPen(opt.palette.color(QPalette.Text))
+        text_rect = opt.rect.adjusted(10, 0, -2 * ICON_WIDTH, 0)
+        title = opt.fontMetrics.elidedText(opt.text, Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, title)
+        painter.drawText(self._rename_rect(opt.rect), Qt.AlignCenter, RENAME_ICON)
+        painter.drawText(self._delete_rect(opt.rect), Qt.AlignCenter, DELETE_ICON)
+        painter.restore()
+
+    def _paint_header(self, painter, option, index):
+        painter.save()
+        font = QFont(option.font)
+        font.setPixelSize(HEADER_FONT_SIZE)
+        painter.setFont(font)
+        painter.setPen(HEADER_COLOR)
+        painter.drawText(option.rect.adjusted(0, 0, 0, -6), Qt.AlignBottom | Qt.AlignLeft, index.data())
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        # Headers share the row height so the view can keep uniform item sizes
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if index.data(HEADER_ROLE):
+            return False
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            filename = index.data(FILENAME_ROLE)
+            if self._rename_rect(option.rect).contains(event.pos()):
+                self.rename_requested.emit(filename)
+            elif self._delete_rect(option.rect).contains(event.pos()):
+                self.delete_requested.emit(filename)
+            else:
+                self.open_requested.emit(filename)
+            return True
+        return super().editorEvent(event, model, option, index)
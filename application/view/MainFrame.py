@@ -16,23 +16,78 @@ interactions of the main window, including the sidebar and content area.
 """
 
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout,
-    QHBoxLayout, QSplitter, QComboBox, QScrollArea, QFrame, QLineEdit, QMessageBox, QInputDialog, QSizePolicy
+    QHBoxLayout, QSplitter, QComboBox, QScrollArea, QFrame, QLineEdit, QMessageBox, QInputDialog, QSizePolicy,
+    QListView, QAbstractItemView
 )
 import sys
 import os
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 
 from model.Language import Language
 from model.Theme import Theme
 from model.ProfileSettings import ProfileSettings
+from model.HistoryLog import format_line, HistoryReader, HistoryIndex
+from view.HistoryList import HistoryModel, HistoryDelegate
+
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes")
+
+
+def _load_qss(theme_name):
+    # Read a theme stylesheet and minify it; Qt's QSS tokenizer cost scales with its size
+    with open(os.path.join(THEMES_DIR, f"{theme_name}.qss"), "r", encoding="utf-8") as f:
+        qss = f.read()
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{};,])\s*", r"\1", qss).strip()
+
+
+def _rename_no_replace(old_path, new_path):
+    # Raises FileExistsError instead of overwriting, without a separate existence check
+    if os.name == "nt":
+        os.rename(old_path, new_path)  # Windows never replaces an existing file here
+        return
+    try:
+        os.link(old_path, new_path)  # Fails atomically if new_path exists
+    except OSError:
+        # Target exists, or no hard links on this filesystem: fall back to a checked rename
+        if os.path.exists(new_path):
+            raise FileExistsError(new_path)
+        os.rename(old_path, new_path)
+        return
+    try:
+        os.unlink(old_path)
+    except OSError:
+        os.unlink(new_path)  # Don't leave the log under both names
+        raise
+
+
+# Theme stylesheets, loaded once at import
+_THEME_QSS = {theme.value: _load_qss(theme.value) for theme in Theme}
+
+# Combo box entries, computed once at import
+_LANG_LABELS = tuple(lang.label for lang in Language)
+_THEME_VALUES = tuple(theme.value for theme in Theme)
+
+# Sidebar section headers, newest first
+HISTORY_SECTIONS = ("Today", "Yesterday", "Previous 14 days")
+OLDER_SECTION = "Older"  # Added on demand by "Load older"
+
+# Chat bubbles built per page when opening or scrolling through a log
+LOG_PAGE_SIZE = 200
 
 
 class MainFrame(QMainWindow):
     language_changed = pyqtSignal(str)
     theme_changed = pyqtSignal(str)
+    log_selected = pyqtSignal(str)
+
+    _STYLE_HEADER = "font-size: 18px; font-weight: bold; color: #333; margin-top: 15px;"
+    _STYLE_EMPTY = "color: #777; font-size: 14px;"
+    _STYLE_SETTING_LABEL = "font-size: 18px; font-weight: bold;"
 
     def __init__(self, profile_settings=None):
         super().__init__()
@@ -40,6 +95,13 @@ class MainFrame(QMainWindow):
         self.setWindowTitle("Interprefy")
         self.setGeometry(100, 100, 1280, 800)
         self.current_log_file = None
+        self._loaded_log_mtime = None
+        self._log_reader = None
+        self._log_next_index = 0
+        self._bubble_labels = []  # Text label of every chat bubble, for resizing
+        self._chat_placeholder = None  # Hint shown while the chat has no bubbles
+        self._bubble_max_width = None
+        self._applied_theme = None
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QHBoxLayout(self.central_widget)
@@ -54,7 +116,6 @@ class MainFrame(QMainWindow):
         self.setup_left_sidebar()
         self.setup_right_content()
         self.apply_theme(self.current_theme)
-        self.language_combo.setCurrentText(self.profile_settings.translated_language.label)
 
     def setup_left_sidebar(self):
         self.left_sidebar = QWidget()
@@ -75,105 +136,51 @@ class MainFrame(QMainWindow):
 
         # History header
         history_label = QLabel("History")
-        history_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #333; margin-top: 15px;")
+        history_label.setStyleSheet(self._STYLE_HEADER)
         self.left_layout.addWidget(history_label)
 
-        self.topic_buttons = []
-
-        # Today header
-        today_label = QLabel("Today")
-        today_label.setStyleSheet("font-size: 14px; color: #777; margin-top: 10px;")
-        self.left_layout.addWidget(today_label)
-
-        logs_path = "history"
-        if os.path.exists(logs_path):
-            txt_files = sorted(
-                [f for f in os.listdir(logs_path) if f.endswith(".txt")],
-                key=lambda f: os.path.getmtime(os.path.join(logs_path, f)),
-                reverse=True
-            )
-            
-            # Organize files by date categories
-            today_files = []
-            yesterday_files = []
-            older_files = []
-            
-            # In a real app, you would categorize the files properly
-            # For demonstration, we'll just split the list
-            if txt_files:
-                third = len(txt_files) // 3
-                today_files = txt_files[:third]
-                yesterday_files = txt_files[third:third*2]
-                older_files = txt_files[third*2:]
-            
-            # Add today's files
-            self.add_file_section(today_files)
-            
-            # Yesterday header
-            yesterday_label = QLabel("Yesterday")
-            yesterday_label.setStyleSheet("font-size: 14px; color: #777; margin-top: 10px;")
-            self.left_layout.addWidget(yesterday_label)
-            
-            # Add yesterday's files
-            self.add_file_section(yesterday_files)
-            
-            # Previous 14 days header
-            previous_label = QLabel("Previous 14 days")
-            previous_label.setStyleSheet("font-size: 14px; color: #777; margin-top: 10px;")
-            self.left_layout.addWidget(previous_label)
-            
-            # Add older files
-            self.add_file_section(older_files)
-            
-        else:
-            label = QLabel("No logs found.")
-            label.setStyleSheet("color: #777; font-size: 14px;")
-            self.left_layout.addWidget(label)
-
-        self.left_layout.addStretch()
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.left_sidebar)
-        scroll_area.setObjectName("leftScrollArea")
-        self.splitter.addWidget(scroll_area)
-
-    def add_file_section(self, files):
-        for filename in files:
-            base_name = os.path.splitext(filename)[0]
-            row = QWidget()
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(0, 0, 0, 0)
-
-            title_btn = QPushButton(base_name)
-            title_btn.setStyleSheet("""
-                QPushButton {
-                    text-align: left;
-                    padding: 10px;
-                    border: none;
-                    background-color: transparent;
-                }
-                QPushButton:hover {
-                    background-color: #f0f0f0;
-                }
-            """)
-            title_btn.clicked.connect(lambda checked, f=filename: self.load_log_content(f))
-
-            rename_btn = QPushButton("✏️")
-            rename_btn.setFixedWidth(30)
-            rename_btn.setStyleSheet("border: none;")
-            rename_btn.clicked.connect(lambda checked, f=filename: self.rename_log(f))
-
-            delete_btn = QPushButton("❌")
-            delete_btn.setFixedWidth(30)
-            delete_btn.setStyleSheet("border: none;")
-            delete_btn.clicked.connect(lambda checked, f=filename: self.delete_log(f))
-
-            row_layout.addWidget(title_btn, 1)
-            row_layout.addWidget(rename_btn)
-            row_layout.addWidget(delete_btn)
-            self.left_layout.addWidget(row)
-            self.topic_buttons.append(row)
+        # Shared painter/click handler for every history row, connected once
+        self.history_delegate = HistoryDelegate(self)
+        self.history_delegate.open_requested.connect(self._open_log)
+        self.history_delegate.rename_requested.connect(self.rename_log)
+        self.history_delegate.delete_requested.connect(self.delete_log)
+
+        # One virtualized list holds the section headers and every log row
+        self.history_model = HistoryModel(self)
+        self.history_view = QListView()
+        self.history_view.setObjectName("historyList")  # Row hover and background come from the theme
+        self.history_view.setModel(self.history_model)
+        self.history_view.setItemDelegate(self.history_delegate)
+        self.history_view.setUniformItemSizes(True)
+        self.history_view.setMouseTracking(True)
+        self.history_view.setFrameShape(QFrame.NoFrame)
+        self.history_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.history_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.no_logs_label = QLabel("No logs found.")
+        self.no_logs_label.setStyleSheet(self._STYLE_EMPTY)
+        self.left_layout.addWidget(self.no_logs_label)
+
+        # The list scrolls itself and takes the remaining height
+        self.left_layout.addWidget(self.history_view, 1)
+
+        # Anything older is loaded lazily
+        self.load_older_btn = QPushButton("Load older")
+        self.load_older_btn.clicked.connect(self.load_older_logs)
+        self.left_layout.addWidget(self.load_older_btn)
+
+        self.refresh_sidebar()
+        self.splitter.addWidget(self.left_sidebar)
+
+    def load_older_logs(self):
+        # Append the rows the "Load older" button stands for, under their own header
+        self.history_model.add_section(OLDER_SECTION, self.archived_files)
+        self.archived_files = []
+        self.load_older_btn.hide()
+
+    def _open_log(self, filename):
+        self.load_log_content(filename)
+        self.log_selected.emit(filename[:-4])
 
     def setup_right_content(self):
         self.right_content = QWidget()
@@ -232,7 +239,41 @@ class MainFrame(QMainWindow):
         self.home_layout.setSpacing(15)
         self.home_layout.addStretch()  # Push content to the top
 
-        # Settings content
+        # Settings content is built on first use (see set_settings_view)
+        self.settings_content = None
+
+        self.content_layout.addWidget(self.home_content)
+        
+        # Set up scroll area for content
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(self.content_stack)
+        scroll_area.setObjectName("contentScrollArea")
+        # Older entries sit at the bottom, reaching it loads the next page
+        scroll_area.verticalScrollBar().valueChanged.connect(self._on_content_scrolled)
+        self.right_layout.addWidget(scroll_area)
+
+        # Audio player at the bottom
+        self.player = QWidget()
+        self.player.setFixedHeight(80)
+        self.player.setObjectName("audioPlayer")
+        self.player_layout = QHBoxLayout(self.player)
+
+        # Both are styled by the theme stylesheet through their object names
+        self.play_btn = QPushButton("▶")
+        self.play_btn.setObjectName("audioPlayButton")
+        self.play_btn.setFixedSize(40, 40)
+        self.waveform = QLabel("Audio Waveform")
+        self.waveform.setObjectName("audioWaveform")
+
+        self.player_layout.addWidget(self.play_btn)
+        self.player_layout.addWidget(self.waveform, 1)
+        self.right_layout.addWidget(self.player)
+
+        self.splitter.addWidget(self.right_content)
+        self.set_home_view()
+
+    def _build_settings_content(self):
         self.settings_content = QWidget()
         settings_layout = QVBoxLayout(self.settings_content)
         settings_layout.setSpacing(20)
@@ -244,11 +285,11 @@ class MainFrame(QMainWindow):
         language_layout.setAlignment(Qt.AlignCenter)
         
         language_label = QLabel("Dropdown ↓")
-        language_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        language_label.setStyleSheet(self._STYLE_SETTING_LABEL)
         language_label.setAlignment(Qt.AlignCenter)
         
         self.language_combo = QComboBox()
-        self.language_combo.addItems([lang.label for lang in Language])
+        self.language_combo.addItems(list(_LANG_LABELS))
         self.language_combo.setStyleSheet("""
             QComboBox {
                 padding: 12px;
@@ -278,11 +319,11 @@ class MainFrame(QMainWindow):
         theme_layout.setAlignment(Qt.AlignCenter)
         
         theme_label = QLabel("Themes ↓")
-        theme_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        theme_label.setStyleSheet(self._STYLE_SETTING_LABEL)
         theme_label.setAlignment(Qt.AlignCenter)
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems([theme.value for theme in Theme])
+        self.theme_combo.addItems(list(_THEME_VALUES))
         self.theme_combo.setStyleSheet("""
             QComboBox {
                 padding: 12px;
@@ -301,59 +342,24 @@ class MainFrame(QMainWindow):
         theme_layout.addWidget(self.theme_combo)
         settings_layout.addWidget(theme_container)
 
+        # Reflect the current profile before listening for user changes
+        self.language_combo.setCurrentText(self.profile_settings.translated_language.label)
+        self.theme_combo.setCurrentText(self.current_theme)
         self.language_combo.currentIndexChanged.connect(self._on_language_changed)
         self.theme_combo.currentIndexChanged.connect(self._on_theme_changed)
 
-        # Add both content widgets to the stack
-        self.content_layout.addWidget(self.home_content)
         self.content_layout.addWidget(self.settings_content)
-        
-        # Set up scroll area for content
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.content_stack)
-        scroll_area.setObjectName("contentScrollArea")
-        self.right_layout.addWidget(scroll_area)
-
-        # Audio player at the bottom
-        self.player = QWidget()
-        self.player.setFixedHeight(80)
-        self.player.setStyleSheet("background-color: #ccc;")
-        self.player.setObjectName("audioPlayer")
-        self.player_layout = QHBoxLayout(self.player)
-
-        self.play_btn = QPushButton("▶")
-        self.play_btn.setFixedSize(40, 40)
-        self.play_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #444;
-                color: white;
-                border-radius: 20px;
-                font-size: 18px;
-            }
-        """)
-        self.waveform = QLabel("Audio Waveform")
-        self.waveform.setStyleSheet("""
-            background-color: #333;
-            color: white;
-            padding: 10px;
-            border-radius: 5px;
-        """)
-
-        self.player_layout.addWidget(self.play_btn)
-        self.player_layout.addWidget(self.waveform, 1)
-        self.right_layout.addWidget(self.player)
-
-        self.splitter.addWidget(self.right_content)
-        self.set_home_view()
 
     def set_home_view(self):
         self.home_btn.setChecked(True)
         self.settings_btn.setChecked(False)
         self.home_content.show()
-        self.settings_content.hide()
+        if self.settings_content is not None:
+            self.settings_content.hide()
 
     def set_settings_view(self):
+        if self.settings_content is None:
+            self._build_settings_content()
         self.settings_btn.setChecked(True)
         self.home_btn.setChecked(False)
         self.settings_content.show()
@@ -370,338 +376,126 @@ class MainFrame(QMainWindow):
         self.theme_changed.emit(theme_label)
 
     def apply_theme(self, theme_name):
-        if theme_name == "Dark":
-            # Dark theme with deep blues and purples
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #080B38;
-                    color: #e0e0ff;
-                }
-                #leftSidebar {
-                    background-color: #36195B;
-                    border-right: 1px solid #4A3B65;
-                }
-                #rightContent {
-                    background-color: #133155;
-                    border-radius: 24px;
-                    margin: 8px;
-                }
-                #navBar {
-                    background-color: #192642;
-                    border-top-left-radius: 24px;
-                    border-top-right-radius: 24px;
-                }
-                QPushButton {
-                    color: #e0e0ff;
-                }
-                QPushButton:hover {
-                    background-color: #2A3A62;
-                }
-                QPushButton:checked {
-                    border-bottom: 3px solid #6F74DD;
-                    color: #8C90E8;
-                }
-                QLabel {
-                    color: #e0e0ff;
-                }
-                .ChatBubble {
-                    background-color: #2A3A62;
-                    color: #e0e0ff;
-                    border-radius: 22px;
-                }
-                .ReceivedBubble {
-                    background-color: #36195B;
-                }
-                .SentBubble {
-                    background-color: #154680;
-                }
-                #audioPlayer {
-                    background-color: #192642;
-                    border-bottom-left-radius: 24px;
-                    border-bottom-right-radius: 24px;
-                }
-                QComboBox {
-                    background-color: #36195B;
-                    color: #e0e0ff;
-                    border: 1px solid #4A3B65;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #36195B;
-                    color: #e0e0ff;
-                    selection-background-color: #4A3B65;
-                }
-                QComboBox::drop-down {
-                    background-color: #36195B;
-                }
-                QScrollBar:vertical {
-                    background-color: #133155;
-                    width: 12px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #36195B;
-                    min-height: 20px;
-                    border-radius: 6px;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    background: none;
-                }
-            """)
-            # Update the play button and waveform for dark theme
-            self.play_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #6F74DD;
-                    color: #e0e0ff;
-                    border-radius: 20px;
-                    font-size: 18px;
-                }
-                QPushButton:hover {
-                    background-color: #8C90E8;
-                }
-            """)
-            self.waveform.setStyleSheet("""
-                background-color: #2A3A62;
-                color: #e0e0ff;
-                padding: 10px;
-                border-radius: 5px;
-            """)
-            
-        elif theme_name == "Light":
-            # Light theme with beige and tan
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #F5F1E6;
-                    color: #5D4037;
-                }
-                #leftSidebar {
-                    background-color: #EAE0CC;
-                    border-right: 1px solid #D1C5A9;
-                }
-                #rightContent {
-                    background-color: #F0E6D2;
-                    border-radius: 24px;
-                    margin: 8px;
-                }
-                #navBar {
-                    background-color: #D1C5A9;
-                    border-top-left-radius: 24px;
-                    border-top-right-radius: 24px;
-                }
-                QPushButton {
-                    color: #5D4037;
-                }
-                QPushButton:hover {
-                    background-color: #E0D4BA;
-                }
-                QPushButton:checked {
-                    border-bottom: 3px solid #A67C52;
-                    color: #8C6D5D;
-                }
-                QLabel {
-                    color: #5D4037;
-                }
-                .ChatBubble {
-                    background-color: #E0D4BA;
-                    color: #5D4037;
-                    border-radius: 22px;
-                }
-                .ReceivedBubble {
-                    background-color: #D1C5A9;
-                }
-                .SentBubble {
-                    background-color: #CBBFAD;
-                }
-                #audioPlayer {
-                    background-color: #D1C5A9;
-                    border-bottom-left-radius: 24px;
-                    border-bottom-right-radius: 24px;
-                }
-                QComboBox {
-                    background-color: #EAE0CC;
-                    color: #5D4037;
-                    border: 1px solid #D1C5A9;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #EAE0CC;
-                    color: #5D4037;
-                    selection-background-color: #D1C5A9;
-                }
-                QComboBox::drop-down {
-                    background-color: #EAE0CC;
-                }
-                QScrollBar:vertical {
-                    background-color: #F0E6D2;
-                    width: 12px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #D1C5A9;
-                    min-height: 20px;
-                    border-radius: 6px;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    background: none;
-                }
-            """)
-            # Update the play button and waveform for light theme
-            self.play_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #A67C52;
-                    color: #F5F1E6;
-                    border-radius: 20px;
-                    font-size: 18px;
-                }
-                QPushButton:hover {
-                    background-color: #8C6D5D;
-                }
-            """)
-            self.waveform.setStyleSheet("""
-                background-color: #D1C5A9;
-                color: #5D4037;
-                padding: 10px;
-                border-radius: 5px;
-            """)
-            
-        else:  # Default - shades of grey
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #f0f0f0;
-                    color: #333;
-                }
-                #leftSidebar {
-                    background-color: #e0e0e0;
-                    border-right: 1px solid #ccc;
-                }
-                #rightContent {
-                    background-color: #d0d0d0;
-                    border-radius: 24px;
-                    margin: 8px;
-                }
-                #navBar {
-                    background-color: #c0c0c0;
-                    border-top-left-radius: 24px;
-                    border-top-right-radius: 24px;
-                }
-                QPushButton {
-                    color: #333;
-                }
-                QPushButton:hover {
-                    background-color: #ccc;
-                }
-                QPushButton:checked {
-                    border-bottom: 3px solid #555;
-                    color: #000;
-                }
-                QLabel {
-                    color: #333;
-                }
-                .ChatBubble {
-                    background-color: #bbb;
-                    color: #333;
-                    border-radius: 22px;
-                }
-                .ReceivedBubble {
-                    background-color: #aaa;
-                }
-                .SentBubble {
-                    background-color: #999;
-                }
-                #audioPlayer {
-                    background-color: #c0c0c0;
-                    border-bottom-left-radius: 24px;
-                    border-bottom-right-radius: 24px;
-                }
-                QComboBox {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border: 1px solid #ccc;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    selection-background-color: #ccc;
-                }
-                QComboBox::drop-down {
-                    background-color: #e0e0e0;
-                }
-                QScrollBar:vertical {
-                    background-color: #d0d0d0;
-                    width: 12px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #aaa;
-                    min-height: 20px;
-                    border-radius: 6px;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    background: none;
-                }
-            """)
-            # Update the play button and waveform for default theme
-            self.play_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #555;
-                    color: white;
-                    border-radius: 20px;
-                    font-size: 18px;
-                }
-                QPushButton:hover {
-                    background-color: #777;
-                }
-            """)
-            self.waveform.setStyleSheet("""
-                background-color: #aaa;
-                color: #333;
-                padding: 10px;
-                border-radius: 5px;
-            """)
+        # Re-applying a window stylesheet repolishes every widget, so skip no-op changes
+        if theme_name == self._applied_theme:
+            return
+        # setStyleSheet already repolishes the whole tree; hold painting so it redraws once
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(_THEME_QSS.get(theme_name, _THEME_QSS[Theme.DEFAULT.value]))
+        finally:
+            self.setUpdatesEnabled(True)
+        self._applied_theme = theme_name
 
     def set_subtitle_window(self, subtitle_window):
         self.subtitle_window = subtitle_window
 
     def load_log_content(self, filename):
+        if filename is None:
+            self._show_empty_chat()
+            return
         try:
-            self.current_log_file = filename
             path = os.path.join("history", filename)
-            
-            # Clear existing chat bubbles
-            for i in reversed(range(self.home_layout.count())):
-                widget = self.home_layout.itemAt(i).widget()
-                if widget is not None and widget != self.home_layout.itemAt(self.home_layout.count()-1).widget():
-                    widget.setParent(None)
-            
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-                # Remove all widgets except the stretch at the end
-                for i in reversed(range(self.home_layout.count())):
-                    item = self.home_layout.itemAt(i)
-                    widget = item.widget()
-                    # Only remove if it's not the stretch (which has no widget)
-                    if widget is not None:
-                        widget.setParent(None)
-
-                if not content.strip():
-                    empty_label = QLabel("(Empty log file)")
-                    empty_label.setAlignment(Qt.AlignCenter)
-                    self.home_layout.addWidget(empty_label)
-                else:
-                    lines = content.split('\n')
-                    is_sent = True
-                    for line in lines:
-                        if line.strip():
-                            self.add_chat_bubble(line, is_sent)
-                            is_sent = not is_sent
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                mtime = None
 
+            # Nothing to rebuild if this exact version of the log is already shown
+            if mtime is not None and filename == self.current_log_file and mtime == self._loaded_log_mtime:
                 self.set_home_view()
+                return
+            self.current_log_file = filename
+            self._loaded_log_mtime = mtime
+
+            self._clear_chat()
+
+            # Only offsets are kept, the bubbles are built one page at a time
+            self._log_reader = HistoryReader(path)
+            self._log_next_index = len(self._log_reader)
+
+            self.home_layout.addStretch()  # Push content to the top
+            if not self._log_next_index:
+                self._set_chat_placeholder("(Empty log file)")
+            else:
+                self._load_older_page()
+
+            self.set_home_view()
                 
+            # Switch the overlay on the next tick so the new bubbles paint first
             if hasattr(self, "subtitle_window"):
-                self.subtitle_window.set_subtitle_file(path)
+                QTimer.singleShot(0, lambda p=path: self.subtitle_window.set_subtitle_file(p))
                 
         except Exception as e:
+            self._log_reader = None
             error_label = QLabel(f"Error loading file: {e}")
             self.home_layout.addWidget(error_label)
             self.set_home_view()
 
+    def _clear_chat(self):
+        # Clear existing chat bubbles (and the stretch) in a single pass
+        self._bubble_labels.clear()
+        self._chat_placeholder = None
+        while self.home_layout.count():
+            item = self.home_layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.deleteLater()
+
+    def _set_chat_placeholder(self, text):
+        self._chat_placeholder = QLabel(text)
+        self._chat_placeholder.setAlignment(Qt.AlignCenter)
+        self.home_layout.insertWidget(0, self._chat_placeholder)
+
+    def _show_empty_chat(self):
+        # No log yet, e.g. after deleting the last one; it is created with the first message
+        self.current_log_file = None
+        self._loaded_log_mtime = None
+        self._log_reader = None
+        self._log_next_index = 0
+        self._clear_chat()
+        self.home_layout.addStretch()  # Push content to the top
+        self._set_chat_placeholder("Start a new chat")
+        self.set_home_view()
+
+    def _load_older_page(self):
+        if self._log_reader is None or not self._log_next_index:
+            return
+        start = max(0, self._log_next_index - LOG_PAGE_SIZE)
+        try:
+            entries = self._log_reader.read(start, self._log_next_index)
+        except OSError as e:
+            # The log changed under us (e.g. deleted outside the app); stop paging it
+            print(f"[Error] {e}")
+            self._log_reader = None
+            return
+        self._log_next_index = start
+
+        # Build the page with painting off so the layout settles once
+        self.home_content.setUpdatesEnabled(False)
+        self.right_content.setUpdatesEnabled(False)
+        try:
+            # Newest first, appended in order rather than each inserted at the top
+            for text, is_sent in reversed(entries):
+                self.add_chat_bubble_append(text, is_sent)
+        finally:
+            self.right_content.setUpdatesEnabled(True)
+            self.home_content.setUpdatesEnabled(True)
+
+    def _on_content_scrolled(self, value):
+        scroll_bar = self.sender()
+        if value == scroll_bar.maximum() and self.home_content.isVisible():
+            self._load_older_page()
+
     def add_chat_bubble(self, text, is_sent=False):
+        # Newest message goes on top
+        self.home_layout.insertWidget(0, self._build_chat_bubble(text, is_sent))
+
+    def add_chat_bubble_append(self, text, is_sent=False):
+        # Bulk loading appends in display order, above the trailing stretch
+        self.home_layout.insertWidget(self.home_layout.count() - 1, self._build_chat_bubble(text, is_sent))
+
+    def _build_chat_bubble(self, text, is_sent):
         bubble = QWidget()
         bubble_layout = QHBoxLayout(bubble)
         bubble_layout.setContentsMargins(0, 0, 0, 0)
@@ -715,67 +509,36 @@ class MainFrame(QMainWindow):
         # Dynamically set max width based on home_content width
         max_width = int(self.home_content.width() * 0.95) if self.home_content.width() > 0 else 900
         text_label.setMaximumWidth(max_width)
-        text_label.setStyleSheet("""
-            padding: 18px;
-            border-radius: 22px;
-            font-size: 20px;
-            line-height: 1.4;
-        """)
 
+        # Colors and shape come from the theme stylesheet's QLabel[bubbleKind=...] rules
         if is_sent:
             bubble_layout.setAlignment(Qt.AlignRight)
-            if self.current_theme == "Dark":
-                text_label.setStyleSheet(text_label.styleSheet() + """
-                    background-color: #154680;
-                    color: #e0e0ff;
-                    border-top-right-radius: 8px;
-                """)
-            elif self.current_theme == "Light":
-                text_label.setStyleSheet(text_label.styleSheet() + """
-                    background-color: #CBBFAD;
-                    color: #5D4037;
-                    border-top-right-radius: 8px;
-                """)
-            else:  # Default
-                text_label.setStyleSheet(text_label.styleSheet() + """
-                    background-color: #999;
-                    color: #fff;
-                    border-top-right-radius: 8px;
-                """)
-            text_label.setProperty("class", "ChatBubble SentBubble")
+            text_label.setProperty("bubbleKind", "sent")
         else:
             bubble_layout.setAlignment(Qt.AlignLeft)
-            if self.current_theme == "Dark":
-                text_label.setStyleSheet(text_label.styleSheet() + """
-                    background-color: #36195B;
-                    color: #e0e0ff;
-                    border-top-left-radius: 8px;
-                """)
-            elif self.current_theme == "Light":
-                text_label.setStyleSheet(text_label.styleSheet() + """
-                    background-color: #D1C5A9;
-                    color: #5D4037;
-                    border-top-left-radius: 8px;
-                """)
-            else:  # Default
-                text_label.setStyleSheet(text_label.styleSheet() + """
-                    background-color: #aaa;
-                    color: #333;
-                    border-top-left-radius: 8px;
-                """)
-            text_label.setProperty("class", "ChatBubble ReceivedBubble")
+            text_label.setProperty("bubbleKind", "received")
 
         bubble_layout.addWidget(text_label)
-        self.home_layout.insertWidget(0, bubble)
+        self._bubble_labels.append(text_label)
+        return bubble
 
     def append_to_current_log(self, text):
+        if self.current_log_file is None:
+            # The empty chat gets its log file only once there is something to write
+            self.current_log_file = datetime.now().strftime("%b %d, %Y") + ".txt"
+            HistoryIndex.invalidate()
+            QTimer.singleShot(0, self.refresh_sidebar)
         if self.current_log_file:
             path = os.path.join("history", self.current_log_file)
             with open(path, "a", encoding="utf-8") as f:
-                f.write(f"\n{text}")
-            self.load_log_content(self.current_log_file)
-            
-            # Add new bubble directly (optimization)
+                f.write("\n" + format_line(text, True))
+                f.flush()
+                # The view already mirrors the file, so only the new bubble is needed
+                self._loaded_log_mtime = os.fstat(f.fileno()).st_mtime
+            if self._chat_placeholder is not None:
+                self.home_layout.removeWidget(self._chat_placeholder)
+                self._chat_placeholder.deleteLater()
+                self._chat_placeholder = None
             self.add_chat_bubble(text, True)
 
     def rename_log(self, filename):
@@ -785,14 +548,24 @@ class MainFrame(QMainWindow):
         if ok and new_name:
             new_filename = f"{new_name}.txt"
             new_path = os.path.join("history", new_filename)
-            if not os.path.exists(new_path):
-                os.rename(old_path, new_path)
-                QMessageBox.information(self, "Renamed", f"Renamed to {new_name}.")
-                self.refresh_sidebar()
-                if hasattr(self, "subtitle_window") and self.subtitle_window.subtitle_file == old_path:
-                    self.subtitle_window.set_subtitle_file(new_path)
-            else:
+            try:
+                _rename_no_replace(old_path, new_path)
+            except FileExistsError:
                 QMessageBox.warning(self, "File Exists", f"A log with name '{new_name}' already exists.")
+                return
+            except OSError as e:
+                QMessageBox.critical(self, "Error", f"Failed to rename: {e}")
+                return
+            HistoryIndex.invalidate()
+            # The open log keeps its contents, so only its path changes
+            if filename == self.current_log_file:
+                self.current_log_file = new_filename
+                if self._log_reader is not None:
+                    self._log_reader.path = new_path
+            QMessageBox.information(self, "Renamed", f"Renamed to {new_name}.")
+            self.refresh_sidebar()
+            if hasattr(self, "subtitle_window") and self.subtitle_window.subtitle_file == old_path:
+                self.subtitle_window.set_subtitle_file(new_path)
 
     def delete_log(self, filename):
         reply = QMessageBox.question(
@@ -804,104 +577,52 @@ class MainFrame(QMainWindow):
         if reply == QMessageBox.Yes:
             try:
                 os.remove(os.path.join("history", filename))
+                HistoryIndex.invalidate()
                 QMessageBox.information(self, "Deleted", f"'{filename}' has been deleted.")
-                self.refresh_sidebar()
+                remaining = self.refresh_sidebar()
                 if hasattr(self, "subtitle_window") and os.path.basename(self.subtitle_window.subtitle_file) == filename:
                     self.subtitle_window.set_subtitle_file("")
-                remaining = sorted(
-                    [f for f in os.listdir("history") if f.endswith(".txt")],
-                    key=lambda f: os.path.getmtime(os.path.join("history", f)),
-                    reverse=True
-                )
-                if remaining:
-                    self.load_log_content(remaining[0])
-                else:
-                    new_file = datetime.now().strftime("%b %d, %Y") + ".txt"
-                    path = os.path.join("history", new_file)
-                    with open(path, "w", encoding="utf-8") as f:
-                        f.write("")
-                    self.load_log_content(new_file)
+                # With nothing left, show an empty chat; a log is created on the first message
+                self.load_log_content(remaining[0][0] if remaining else None)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete: {e}")
 
     def refresh_sidebar(self):
-        for btn in self.topic_buttons:
-            self.left_layout.removeWidget(btn)
-            btn.deleteLater()
-        self.topic_buttons.clear()
-
-        # Clear the left sidebar
-        while self.left_layout.count() > 1:
-            item = self.left_layout.takeAt(1)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-                
-        # Add history header
-        history_label = QLabel("History")
-        history_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #333; margin-top: 15px;")
-        self.left_layout.addWidget(history_label)
-        
-        # Today header
-        today_label = QLabel("Today")
-        today_label.setStyleSheet("font-size: 14px; color: #777; margin-top: 10px;")
-        self.left_layout.addWidget(today_label)
-
         logs_path = "history"
-        if os.path.exists(logs_path):
-            txt_files = sorted(
-                [f for f in os.listdir(logs_path) if f.endswith(".txt")],
-                key=lambda f: os.path.getmtime(os.path.join(logs_path, f)),
-                reverse=True
-            )
-            
-            # Organize files by date categories (simplified)
-            today_files = []
-            yesterday_files = []
-            older_files = []
-            
-            if txt_files:
-                third = len(txt_files) // 3
-                today_files = txt_files[:third]
-                yesterday_files = txt_files[third:third*2]
-                older_files = txt_files[third*2:]
-            
-            # Add today's files
-            self.add_file_section(today_files)
-            
-            # Yesterday header
-            yesterday_label = QLabel("Yesterday")
-            yesterday_label.setStyleSheet("font-size: 14px; color: #777; margin-top: 10px;")
-            self.left_layout.addWidget(yesterday_label)
-            
-            # Add yesterday's files
-            self.add_file_section(yesterday_files)
-            
-            # Previous 14 days header
-            previous_label = QLabel("Previous 14 days")
-            previous_label.setStyleSheet("font-size: 14px; color: #777; margin-top: 10px;")
-            self.left_layout.addWidget(previous_label)
-            
-            # Add older files
-            self.add_file_section(older_files)
-            
-        else:
-            label = QLabel("No logs found.")
-            label.setStyleSheet("color: #777; font-size: 14px;")
-            self.left_layout.addWidget(label)
+        self.no_logs_label.setVisible(not os.path.exists(logs_path))
+
+        # Day boundaries are computed once, then each log needs a single comparison
+        today = datetime.now().date()
+        today_start = datetime.combine(today, datetime.min.time()).timestamp()
+        yesterday_start = datetime.combine(today - timedelta(days=1), datetime.min.time()).timestamp()
+        cutoff = datetime.combine(today - timedelta(days=14), datetime.min.time()).timestamp()
+
+        # Organize files by date categories; the listing is newest first, so each stays sorted
+        today_files = []
+        yesterday_files = []
+        older_files = []
+        self.archived_files = []  # Older than 14 days, only added on request
+        entries = HistoryIndex.list_txt(logs_path)
+        for name, mtime in entries:
+            if mtime >= today_start:
+                today_files.append(name)
+            elif mtime >= yesterday_start:
+                yesterday_files.append(name)
+            elif mtime >= cutoff:
+                older_files.append(name)
+            else:
+                self.archived_files.append(name)
+        self.load_older_btn.setVisible(bool(self.archived_files))
 
-        self.left_layout.addStretch()
-        
-        # Reapply current theme after refreshing
-        self.apply_theme(self.current_theme)
+        # Swap the rows in one model reset
+        self.history_model.set_sections(zip(HISTORY_SECTIONS, (today_files, yesterday_files, older_files)))
+        return entries
 
     def resizeEvent(self, event):
-        # Dynamically update bubble widths on resize
-        for i in range(self.home_layout.count()):
-            widget = self.home_layout.itemAt(i).widget()
-            if widget:
-                label = widget.findChild(QLabel)
-                if label:
-                    max_width = int(self.home_content.width() * 0.95)
-                    label.setMaximumWidth(max_width)
+        # Dynamically update bubble widths on resize, only when the width actually changes
+        max_width = int(self.home_content.width() * 0.95)
+        if max_width != self._bubble_max_width:
+            self._bubble_max_width = max_width
+            for label in self._bubble_labels:
+                label.setMaximumWidth(max_width)
         super().resizeEvent(event)
\ No newline at end of file
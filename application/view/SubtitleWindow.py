@@ -5,19 +5,20 @@
 
 This class is responsible for:
     - Creating a transparent, always-on-top subtitle display window using PyQt5.
-    - Periodically reading a text history file for updated translated lines.
+    - Watching a text history file for newly appended translated lines.
     - Displaying new subtitle lines on the screen as they become available.
     - Automatically adjusting the size and position of the overlay window.
 
 Features:
     - Frameless, translucent UI with styled text for readability.
-    - Monitors the latest file in the 'history' folder for real-time updates.
-    - Only displays every second line (assuming translated lines follow source).
+    - Monitors the latest file in the 'history' folder for real-time updates,
+      through native file change notifications rather than a polling loop.
+    - Only displays translated lines (R-prefixed, or every second line in older logs).
     - Designed to integrate with systems producing translation output to file.
 
 Dependencies:
-    - PyQt5 for UI components and timers.
-    - Standard Python libraries for file handling and datetime.
+    - PyQt5 for UI components, timers and file watching.
+    - Standard Python libraries for file handling.
 
 Note: This window is presentation-only and does not handle audio capture or translation.
 """
@@ -25,15 +26,84 @@ Note: This window is presentation-only and does not handle audio capture or tran
 
 import os
 import sys
-from datetime import datetime
+from collections import deque
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QDesktopWidget, QApplication
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QFileSystemWatcher, QObject, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont
+from model.HistoryLog import parse_lines, HistoryIndex
+
+
+class _HistoryTailReader(QObject):
+    # Reads lines appended to a history file; lives on its own thread so slow storage can't stall the UI
+    lines_read = pyqtSignal(str, list)  # Path and the translated lines appended to it
+
+    def __init__(self):
+        super().__init__()
+        self._path = ""
+        self._file_pos = 0  # Bytes of the file consumed so far
+        self._last_mtime = None
+
+    @pyqtSlot(str)
+    def set_path(self, path):
+        self._path = path
+        self._file_pos = 0
+        self._last_mtime = None
+        self.read_new_lines()
+
+    @pyqtSlot()
+    def read_new_lines(self):
+        if not self._path:
+            return
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return
+
+        # A stat is enough to tell that nothing was appended since the last read
+        if st.st_size == self._file_pos and st.st_mtime == self._last_mtime:
+            return
+        if st.st_size < self._file_pos:
+            self._file_pos = 0  # Truncated or replaced, start over
+
+        try:
+            with open(self._path, "rb") as f:
+                f.seek(self._file_pos)
+                data = f.read()
+        except Exception as e:
+            print("Error reading file:", e)
+            return
+        self._last_mtime = st.st_mtime
+
+        # Only complete lines are consumed, a half-written one is read next time
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return
+        self._file_pos += end
+        new_lines = data[:end].decode("utf-8", errors="replace").splitlines()
+
+        # Only the translated side of each entry is shown as a subtitle
+        translated = [text for text, is_sent in parse_lines(new_lines) if not is_sent]
+        if translated:
+            self.lines_read.emit(self._path, translated)
+
+
+def _stop_thread(thread):
+    # A QThread destroyed while running aborts the app, so wait for it to finish
+    if thread.isRunning():
+        thread.quit()
+        thread.wait()
 
 
 class SubtitleWindow(QWidget):
+    _STYLE_LABEL = "color: white; font-size: 28px; padding: 10px;"
+    MAX_QUEUED_LINES = 512  # Oldest unshown subtitles are dropped past this
+
+    # Queued to the reader thread
+    _path_changed = pyqtSignal(str)
+    _read_requested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowFlags(
@@ -53,71 +123,143 @@ class SubtitleWindow(QWidget):
         self.setStyleSheet("background-color: rgba(0, 0, 0, 180); border-radius: 10px;")
         self.adjust_size_and_position()
 
+        # Geometry only depends on the screen, so it is recomputed when that changes
+        app = QApplication.instance()
+        self._screen = app.primaryScreen()
+        self._screen.geometryChanged.connect(self._on_screen_changed)
+        app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+
         # History setup
         self.history_folder = "history"
         os.makedirs(self.history_folder, exist_ok=True)
 
-        self.history_path = self.get_latest_history_file()
-        self.translated_lines = []
-        self.current_index = 0
-        self.line_count = 0  # Total lines tracked so far
+        self.history_path = self.get_latest_history_file() or ""
+        self.translated_lines = deque(maxlen=self.MAX_QUEUED_LINES)  # Not yet shown
+        self._live = False  # True while a recording feeds the label directly
 
+        # File reads happen on the reader's thread, results come back as queued signals
+        # No Qt parent: the thread must outlive the window's children to be stopped on destruction
+        self._reader_thread = QThread()
+        self._reader = _HistoryTailReader()
+        self._reader.moveToThread(self._reader_thread)
+        self._reader_thread.finished.connect(self._reader.deleteLater)
+        self._path_changed.connect(self._reader.set_path)
+        self._read_requested.connect(self._reader.read_new_lines)
+        self._reader.lines_read.connect(self._on_lines_read)
+        self._reader_thread.start()
+        QApplication.instance().aboutToQuit.connect(self._stop_reader)
+        # The window's wrapper is gone by then, so the slot only holds the thread
+        self.destroyed.connect(lambda *_, t=self._reader_thread: _stop_thread(t))
+
+        # Qt's watcher sits on the platform's native notifications (inotify,
+        # ReadDirectoryChangesW, FSEvents), so an idle file costs nothing
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        self.watcher.directoryChanged.connect(self._on_folder_changed)
+        self.watcher.addPath(self.history_folder)
+
+        # Only used when the file itself can't be watched
         self.poll_timer = QTimer(self)
         self.poll_timer.timeout.connect(self.check_for_updates)
-        self.poll_timer.start(1000)  # Check every 1 second
+        self._watch(self.history_path)
+        self._path_changed.emit(self.history_path)
 
     def _setup_label(self, label: QLabel):
         label.setFont(QFont("Arial", 20))
         label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet("color: white; font-size: 28px; padding: 10px;")
+        label.setStyleSheet(self._STYLE_LABEL)
 
     def get_latest_history_file(self):
-        files = [f for f in os.listdir(self.history_folder) if f.endswith(".txt")]
+        files = HistoryIndex.list_txt(self.history_folder)
         if not files:
-            # Create a dummy file to track
-            filename = datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".txt"
-            path = os.path.join(self.history_folder, filename)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("")
-            return path
+            return None  # Nothing to display until a log is written
 
-        latest = max(files, key=lambda f: os.path.getmtime(os.path.join(self.history_folder, f)))
-        return os.path.join(self.history_folder, latest)
+        # The index is sorted newest first
+        return os.path.join(self.history_folder, files[0][0])
 
-    def check_for_updates(self):
-        try:
-            with open(self.history_path, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
-        except Exception as e:
-            print("Error reading file:", e)
+    @property
+    def subtitle_file(self):
+        return self.history_path
+
+    def set_subtitle_file(self, path):
+        # Follow another history file from its start; an empty path stops tracking
+        self.history_path = path
+        self.translated_lines.clear()
+        self._watch(path)
+        self._path_changed.emit(path)
+
+    def _watch(self, path):
+        files = self.watcher.files()
+        if files:
+            self.watcher.removePaths(files)
+        if path and not self.watcher.addPath(path):
+            self.poll_timer.start(1000)  # Fall back to checking every 1 second
+        else:
+            self.poll_timer.stop()
+
+    def _on_file_changed(self, path):
+        # A file replaced on disk drops out of the watch, so add it back
+        if path not in self.watcher.files() and os.path.exists(path):
+            self.watcher.addPath(path)
+        self.check_for_updates()
+
+    def _on_folder_changed(self, folder):
+        # A newer log, e.g. from a new session, takes over the overlay
+        HistoryIndex.invalidate()
+        files = HistoryIndex.list_txt(self.history_folder)
+        if not files:
             return
+        latest_name, latest_mtime = files[0]
+        latest = os.path.join(self.history_folder, latest_name)
+        if latest == self.history_path:
+            return
+        # The listing already holds every mtime, so nothing is stat'ed again
+        current_mtime = dict(files).get(os.path.basename(self.history_path))
+        if current_mtime is None or latest_mtime > current_mtime:  # None: the tracked file is gone
+            self.set_subtitle_file(latest)
 
-        # Check if new lines were added
-        if len(lines) > self.line_count:
-            new_lines = lines[self.line_count:]
-            self.line_count = len(lines)
+    def check_for_updates(self):
+        self._read_requested.emit()
 
-            # Translated lines are every other one starting at index 1
-            for i in range(1, len(new_lines), 2):
-                self.translated_lines.append(new_lines[i])
+    def _on_lines_read(self, path, lines):
+        # Lines read before a switch to another file are stale, and while
+        # recording the live callbacks already showed what the log contains
+        if path != self.history_path or self._live:
+            return
+        self.translated_lines.extend(lines)
+        self.display_next()
 
-            self.display_next()
+    def _stop_reader(self):
+        _stop_thread(self._reader_thread)
 
     def display_next(self):
-        if self.current_index < len(self.translated_lines):
-            text = self.translated_lines[self.current_index]
-            self.layout.removeWidget(self.label)
-            self.label.deleteLater()
+        if self.translated_lines:
+            # Show the newest line; older ones from the same read are already out of date.
+            # Only the text changes; Qt repaints once control returns to the event loop
+            self.label.setText(self.translated_lines[-1])
+            self.translated_lines.clear()
+
+    def set_live(self, live):
+        # While live, subtitles only come from append_line/update_last_line
+        self._live = live
+        self.translated_lines.clear()
 
-            self.label = QLabel(text)
-            self._setup_label(self.label)
-            self.layout.addWidget(self.label)
+    def append_line(self, original, translated=None):
+        # Show a new subtitle right away; the source text stands in until the translation arrives
+        self.label.setText(translated or original)
 
-            self.adjust_size_and_position()
-            self.repaint()
-            QApplication.processEvents()
+    def update_last_line(self, translated):
+        # Replace the tentative subtitle with its translation
+        self.label.setText(translated)
 
-            self.current_index += 1
+    def _on_primary_screen_changed(self, screen):
+        self._screen.geometryChanged.disconnect(self._on_screen_changed)
+        self._screen = screen
+        self._screen.geometryChanged.connect(self._on_screen_changed)
+        self.adjust_size_and_position()
+
+    def _on_screen_changed(self, *args):
+        self.adjust_size_and_position()
 
     def adjust_size_and_position(self):
         screen = QDesktopWidget().screenGeometry()